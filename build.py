@@ -1,3 +1,5 @@
+import hashlib
+import importlib.util
 import os
 import re
 import subprocess
@@ -6,15 +8,21 @@ import sys
 
 def get_current_version_string():
     """Retrieves the dynamic version string."""
-    # We can import the module directly to use its logic
-    # But we need to ensure we don't pick up a frozen state
-    # Reload in case it was imported before
-    import importlib
+    version_file = os.path.join("flight_manager", "version.py")
+    with open(version_file, "r", encoding="utf-8") as f:
+        src = f.read()
 
-    import flight_manager.version as v
+    # A hardcoded version string can be read without executing anything
+    m = re.search(r'^__version__\s*=\s*["\']([^"\']+)["\']', src, re.M)
+    if m:
+        return m.group(1)
 
-    importlib.reload(v)
-    return v.__version__
+    # Otherwise run version.py on its own (git tag lookup) without importing
+    # or reloading the flight_manager package
+    spec = importlib.util.spec_from_file_location("_fm_version", version_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.__version__
 
 
 def build():
@@ -28,39 +36,59 @@ def build():
     with open(version_file, "r", encoding="utf-8") as f:
         original_content = f.read()
 
+    needs_revert = False
     try:
-        # 2. Hardcode the version in version.py
+        # 2. Hardcode the version in version.py (skip if already identical
+        # so the file's mtime is left alone)
         new_content = re.sub(
             r"__version__ = .*", f'__version__ = "{version}"', original_content
         )
 
-        with open(version_file, "w", encoding="utf-8") as f:
-            f.write(new_content)
+        if new_content != original_content:
+            with open(version_file, "w", encoding="utf-8") as f:
+                f.write(new_content)
+            needs_revert = True
 
         # 3. Handle Icons
-        from PIL import Image
-
         icon_png = "icon.png"
         build_dir = "build"
         if not os.path.exists(build_dir):
             os.makedirs(build_dir)
         icon_ico = os.path.join(build_dir, "icon.ico")
+        icon_hash_file = icon_ico + ".hash"
 
         if os.path.exists(icon_png):
-            print(f"Converting {icon_png} to {icon_ico}...")
-            img = Image.open(icon_png)
-            img.save(
-                icon_ico,
-                format="ICO",
-                sizes=[
-                    (256, 256),
-                    (128, 128),
-                    (64, 64),
-                    (48, 48),
-                    (32, 32),
-                    (16, 16),
-                ],
-            )
+            with open(icon_png, "rb") as f:
+                icon_hash = hashlib.blake2b(
+                    f.read(), digest_size=16
+                ).hexdigest()
+
+            cached_hash = None
+            if os.path.exists(icon_hash_file):
+                with open(icon_hash_file, "r", encoding="utf-8") as f:
+                    cached_hash = f.read().strip()
+
+            # Only re-encode the ICO when icon.png has changed
+            if os.path.exists(icon_ico) and cached_hash == icon_hash:
+                print(f"{icon_ico} is up to date, skipping conversion.")
+            else:
+                from PIL import Image
+
+                print(f"Converting {icon_png} to {icon_ico}...")
+                with Image.open(icon_png) as src:
+                    # Decode once and release the source file handle
+                    src.load()
+                    img = src.convert("RGBA")
+                # Skip sizes larger than the source to avoid upscaling
+                sizes = [
+                    (s, s)
+                    for s in (256, 128, 64, 48, 32, 16)
+                    if s <= max(img.size)
+                ]
+                img.save(icon_ico, format="ICO", sizes=sizes)
+
+                with open(icon_hash_file, "w", encoding="utf-8") as f:
+                    f.write(icon_hash)
 
         # 4. Run PyInstaller
         # If a name is passed as argument, use it. Otherwise use FlightManager-{version}
@@ -86,8 +114,17 @@ def build():
 
         cmd.append("main.py")
 
+        # Keep PyInstaller's binary cache inside build/ so repeated builds
+        # reuse it. --clean is deliberately not passed for the same reason.
+        env = {
+            **os.environ,
+            "PYINSTALLER_CONFIG_DIR": os.path.abspath(
+                os.path.join(build_dir, "pyinstaller")
+            ),
+        }
+
         print(f"Running: {' '.join(cmd)}")
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env=env)
 
         print(f"Build complete. Executable: dist/{target_name}.exe")
 
@@ -99,9 +136,10 @@ def build():
         sys.exit(1)
     finally:
         # 4. Revert version.py
-        print("Reverting version.py...")
-        with open(version_file, "w", encoding="utf-8") as f:
-            f.write(original_content)
+        if needs_revert:
+            print("Reverting version.py...")
+            with open(version_file, "w", encoding="utf-8") as f:
+                f.write(original_content)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,27 @@ data insertion, querying, and schema migrations.
 
 import sqlite3
 import contextlib
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+# Sortable log columns and the expression each one is ordered by
+_SORT_EXPRESSIONS = {
+    "id": "id",
+    "flight_no": "CAST(flight_no AS INTEGER)",
+    "date": "date",
+    "vehicle_name": "vehicle_name",
+    "system_check": "system_check",
+    "mission_title": "mission_title",
+    "note": "note",
+    "is_locked": "is_locked",
+}
+_ALLOWED_SORT = frozenset(_SORT_EXPRESSIONS)
+
+# Pre-built ORDER BY clauses keyed by (sort_col, sort_desc)
+_ORDER_BY_CLAUSES = {
+    (col, desc): f" ORDER BY {expr} {'DESC' if desc else 'ASC'}"
+    for col, expr in _SORT_EXPRESSIONS.items()
+    for desc in (True, False)
+}
 
 
 class DatabaseManager:
@@ -19,7 +39,33 @@ class DatabaseManager:
             db_name: The name of the database file.
         """
         self.conn = sqlite3.connect(db_name, check_same_thread=False)
+        self._filter_clauses = self._compose_filter_clauses()
+        self._column_cache: Dict[str, Set[str]] = {}
+        # Change tokens for the small configuration tables. Each is bumped
+        # on write; cached list results are only reused while it matches.
+        self._table_versions: Dict[str, int] = {
+            "vehicles": 0,
+            "checklist_config": 0,
+            "ignore_patterns": 0,
+        }
+        self._list_cache: Dict[Any, Tuple[int, List]] = {}
+        # WAL lets readers run alongside the writer and, with NORMAL sync,
+        # avoids an fsync of the journal on every commit. busy_timeout waits
+        # out a briefly held lock instead of failing with "database is locked".
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA cache_size=-64000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA foreign_keys=ON;
+            """
+        )
         self.create_tables()
+        self._settings_cache: Dict[str, str] = {}
+        self._load_settings_cache()
 
     @contextlib.contextmanager
     def _get_cursor(self):
@@ -30,6 +76,64 @@ class DatabaseManager:
         finally:
             cursor.close()
 
+    def _cached_list(self, key: Any, table: str, query: str) -> List:
+        """Runs a configuration list query, reusing the last result.
+
+        The result is stored with the table's change token taken before the
+        query ran, so a write racing a worker-thread read can't leave a
+        stale entry behind.
+
+        Args:
+            key: Cache key for this query.
+            table: The table the query reads, whose token guards the entry.
+            query: The SELECT to run on a miss.
+
+        Returns:
+            A fresh list of the result rows.
+        """
+        version = self._table_versions[table]
+        hit = self._list_cache.get(key)
+        if hit is None or hit[0] != version:
+            with self._get_cursor() as cursor:
+                cursor.execute(query)
+                hit = (version, cursor.fetchall())
+            self._list_cache[key] = hit
+        return list(hit[1])
+
+    def _touch(self, *tables: str):
+        """Marks configuration tables as changed."""
+        for table in tables:
+            self._table_versions[table] += 1
+
+    @property
+    def ignore_patterns_version(self) -> int:
+        """Change token for ignore patterns, for callers holding a copy."""
+        return self._table_versions["ignore_patterns"]
+
+    def get_checklist_change_token(self) -> int:
+        """Returns a token that changes whenever the checklist is edited."""
+        return self._table_versions["checklist_config"]
+
+    def _get_columns(self, table: str) -> Set[str]:
+        """Returns the set of column names of a table using PRAGMA.
+
+        Results are memoized per table until the schema is changed.
+
+        Args:
+            table: Table name.
+
+        Returns:
+            The column names, or an empty set if the table does not exist.
+        """
+        if table not in self._column_cache:
+            with self._get_cursor() as cursor:
+                # PRAGMA returns (cid, name, type, notnull, dflt_value, pk)
+                cursor.execute(f"PRAGMA table_info({table})")
+                self._column_cache[table] = {
+                    row[1] for row in cursor.fetchall()
+                }
+        return self._column_cache[table]
+
     def _column_exists(self, table: str, column: str) -> bool:
         """Checks if a column exists in a table using PRAGMA.
 
@@ -40,130 +144,164 @@ class DatabaseManager:
         Returns:
             True if column exists, False otherwise.
         """
-        with self._get_cursor() as cursor:
-            # PRAGMA returns (cid, name, type, notnull, dflt_value, pk)
-            cursor.execute(f"PRAGMA table_info({table})")
-            columns = [row[1] for row in cursor.fetchall()]
-        return column in columns
+        return column in self._get_columns(table)
 
     def create_tables(self):
-        """Creates necessary tables and applies migrations safely."""
-        with self._get_cursor() as cursor:
+        """Creates necessary tables and applies migrations safely.
+
+        The schema and any required migrations are applied as a single script
+        inside one transaction.
+        """
+        statements = [
             # 1. Main logs table (Base Schema)
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    flight_no TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    vehicle_name TEXT,
-                    mission_title TEXT,
-                    note TEXT,
-                    system_check TEXT,
-                    parameter_changes TEXT,
-                    log_file_path TEXT,
-                    is_locked INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
             """
+            CREATE TABLE IF NOT EXISTS logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flight_no TEXT NOT NULL,
+                date TEXT NOT NULL,
+                vehicle_name TEXT,
+                mission_title TEXT,
+                note TEXT,
+                system_check TEXT,
+                parameter_changes TEXT,
+                log_file_path TEXT,
+                is_locked INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            # 2. Checklist configuration table
+            """
+            CREATE TABLE IF NOT EXISTS checklist_config (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_name TEXT NOT NULL UNIQUE,
+                item_type TEXT DEFAULT 'checkbox',
+                options TEXT,
+                validation_rule TEXT,
+                order_index INTEGER DEFAULT 0
+            )
+            """,
+            # 3. Vehicles table
+            """
+            CREATE TABLE IF NOT EXISTS vehicles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                is_archived INTEGER DEFAULT 0
+            )
+            """,
+            # 4. Ignore Patterns table
+            """
+            CREATE TABLE IF NOT EXISTS ignore_patterns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                pattern TEXT NOT NULL UNIQUE
             )
+            """,
+            # 5. Settings table
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            """,
+            # 6. Next flight number per date (maintained by triggers below)
+            """
+            CREATE TABLE IF NOT EXISTS flight_seq (
+                date TEXT PRIMARY KEY,
+                next_no INTEGER NOT NULL
+            )
+            """,
+        ]
+        seq_exists = bool(self._get_columns("flight_seq"))
 
-            # 2. Migrations for 'logs' table
-            logs_cols = [
+        # Migrations for columns added after the initial release
+        migrations = {
+            "logs": [
                 ("vehicle_name", "TEXT"),
                 ("log_file_path", "TEXT"),
                 ("mission_title", "TEXT"),
                 ("note", "TEXT"),
-                ("is_locked", "INTEGER DEFAULT 0")
-            ]
-            for col_name, col_type in logs_cols:
-                if not self._column_exists("logs", col_name):
-                    cursor.execute(
-                        f"ALTER TABLE logs ADD COLUMN {col_name} {col_type}"
-                    )
-
-            # 3. Checklist configuration table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS checklist_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    item_name TEXT NOT NULL UNIQUE,
-                    item_type TEXT DEFAULT 'checkbox',
-                    options TEXT,
-                    validation_rule TEXT,
-                    order_index INTEGER DEFAULT 0
-                )
-            """
-            )
-
-            # Migrations for 'checklist_config'
-            checklist_cols = [
+                ("is_locked", "INTEGER DEFAULT 0"),
+            ],
+            "checklist_config": [
                 ("order_index", "INTEGER DEFAULT 0"),
-                ("validation_rule", "TEXT")
-            ]
-            for col_name, col_def in checklist_cols:
-                if not self._column_exists("checklist_config", col_name):
-                    cursor.execute(
-                        f"ALTER TABLE checklist_config ADD COLUMN {col_name} "
-                        f"{col_def}"
+                ("validation_rule", "TEXT"),
+            ],
+            "vehicles": [
+                ("is_archived", "INTEGER DEFAULT 0"),
+            ],
+        }
+        for table, cols in migrations.items():
+            existing = self._get_columns(table)
+            # A missing table is created above with the full schema
+            if not existing:
+                continue
+            for col_name, col_def in cols:
+                if col_name not in existing:
+                    statements.append(
+                        f"ALTER TABLE {table} ADD COLUMN {col_name} {col_def}"
                     )
 
-            # 4. Vehicles table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS vehicles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    is_archived INTEGER DEFAULT 0
-                )
-            """
-            )
-
-            # Migrations for 'vehicles'
-            if not self._column_exists("vehicles", "is_archived"):
-                cursor.execute(
-                    "ALTER TABLE vehicles ADD COLUMN is_archived "
-                    "INTEGER DEFAULT 0"
-                )
-
-            # 5. Ignore Patterns table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ignore_patterns (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    pattern TEXT NOT NULL UNIQUE
-                )
-            """
-            )
+        # Indexes for log filtering/sorting and per-date flight numbering.
+        # Created last so they can cover columns added by the migrations.
+        # (vehicle_name, id) serves the per-vehicle history ORDER BY id DESC
+        # without a temp sort; (date, flight_no) also serves date-only lookups.
+        statements += [
+            "CREATE INDEX IF NOT EXISTS idx_logs_vehicle_id "
+            "ON logs(vehicle_name, id)",
+            "CREATE INDEX IF NOT EXISTS idx_logs_date_flightno "
+            "ON logs(date, CAST(flight_no AS INTEGER))",
+        ]
 
-            # 6. Settings table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """
+        # Keep flight_seq equal to MAX(flight_no) + 1 for every date, in the
+        # same transaction as the write that changes it.
+        seq_recompute = (
+            "UPDATE flight_seq SET next_no = ("
+            "SELECT COALESCE(MAX(CAST(flight_no AS INTEGER)), 0) + 1 "
+            "FROM logs WHERE date = OLD.date) WHERE date = OLD.date;"
+        )
+        seq_bump = (
+            "INSERT INTO flight_seq (date, next_no) "
+            "VALUES (NEW.date, CAST(NEW.flight_no AS INTEGER) + 1) "
+            "ON CONFLICT(date) DO UPDATE "
+            "SET next_no = MAX(next_no, excluded.next_no);"
+        )
+        statements += [
+            "CREATE TRIGGER IF NOT EXISTS trg_logs_seq_insert "
+            f"AFTER INSERT ON logs BEGIN {seq_bump} END",
+            "CREATE TRIGGER IF NOT EXISTS trg_logs_seq_update "
+            "AFTER UPDATE OF flight_no, date ON logs "
+            f"BEGIN {seq_recompute} {seq_bump} END",
+            "CREATE TRIGGER IF NOT EXISTS trg_logs_seq_delete "
+            f"AFTER DELETE ON logs BEGIN {seq_recompute} END",
+        ]
+        if not seq_exists:
+            # Backfill from logs recorded before the table existed
+            statements.append(
+                "INSERT INTO flight_seq (date, next_no) "
+                "SELECT date, COALESCE(MAX(CAST(flight_no AS INTEGER)), 0) + 1 "
+                "FROM logs GROUP BY date"
             )
 
-            self.conn.commit()
+        script = "BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;"
+        try:
+            self.conn.executescript(script)
+        except sqlite3.Error:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            raise
+        finally:
+            # Tables may have been created or altered by the script
+            self._column_cache.clear()
+        # Rows migrated with the order_index default all share 0
+        with self.conn, self._get_cursor() as cursor:
+            self._renumber_checklist_order(cursor)
         self.seed_defaults()
 
     def seed_defaults(self):
         """Seeds the database with default values if tables are empty."""
         with self._get_cursor() as cursor:
-            # Default Font Size
-            cursor.execute(
-                "SELECT COUNT(*) FROM settings WHERE key = 'font_size'"
-            )
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(
-                    "INSERT INTO settings (key, value) VALUES (?, ?)",
-                    ("font_size", "10")
-                )
-
-            # Default Feature Settings
-            feature_defaults = [
+            # Default Font Size and Feature Settings
+            setting_defaults = [
+                ("font_size", "10"),
                 ("enable_edit_log", "1"),
                 ("enable_delete_log", "1"),
                 ("enable_update_params", "1"),
@@ -171,26 +309,22 @@ class DatabaseManager:
                 ("log_max_size_gb", "0"),
                 ("log_retention_days", "0"),
             ]
-            for key, val in feature_defaults:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM settings WHERE key = ?", (key,)
-                )
-                if cursor.fetchone()[0] == 0:
-                    cursor.execute(
-                        "INSERT INTO settings (key, value) VALUES (?, ?)",
-                        (key, val)
-                    )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
+                setting_defaults,
+            )
 
-            # Default Vehicle
-            cursor.execute("SELECT COUNT(*) FROM vehicles")
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(
-                    "INSERT INTO vehicles (name) VALUES (?)", ("Default Drone",)
-                )
+            # Default Vehicle (only on an empty table)
+            cursor.execute(
+                "INSERT INTO vehicles (name) SELECT ? "
+                "WHERE NOT EXISTS (SELECT 1 FROM vehicles)",
+                ("Default Drone",),
+            )
 
-            # Default Checklist
-            cursor.execute("SELECT COUNT(*) FROM checklist_config")
-            if cursor.fetchone()[0] == 0:
+            # Default Checklist (only on an empty table, so items the user
+            # deleted are not re-created on the next start)
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM checklist_config)")
+            if not cursor.fetchone()[0]:
                 defaults = [
                     ("Battery Charged", "checkbox", None, 0),
                     ("Props Secure", "checkbox", None, 1),
@@ -204,7 +338,7 @@ class DatabaseManager:
                     ("Voltage (V)", "text", None, 4),
                 ]
                 cursor.executemany(
-                    "INSERT INTO checklist_config "
+                    "INSERT OR IGNORE INTO checklist_config "
                     "(item_name, item_type, options, order_index) "
                     "VALUES (?, ?, ?, ?)",
                     defaults,
@@ -214,6 +348,11 @@ class DatabaseManager:
 
     def close(self):
         """Closes the database connection."""
+        try:
+            # Refresh query planner statistics before shutting down
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         self.conn.close()
 
     # --- Vehicles ---
@@ -227,17 +366,33 @@ class DatabaseManager:
             A list of vehicle names or tuples (name, is_archived) if
             include_archived is True.
         """
-        with self._get_cursor() as cursor:
-            if include_archived:
-                cursor.execute(
-                    "SELECT name, is_archived FROM vehicles ORDER BY name"
-                )
-                return cursor.fetchall()
+        if include_archived:
+            return self._cached_list(
+                ("vehicles", True),
+                "vehicles",
+                "SELECT name, is_archived FROM vehicles ORDER BY name",
+            )
+        return self.get_vehicle_names(include_archived=False)
 
-            cursor.execute(
+    def get_vehicle_names(self, include_archived: bool = True) -> List[str]:
+        """Retrieves vehicle names only.
+
+        Args:
+            include_archived: Whether to include archived vehicles.
+
+        Returns:
+            A list of vehicle names, ordered by name.
+        """
+        if include_archived:
+            query = "SELECT name FROM vehicles ORDER BY name"
+        else:
+            query = (
                 "SELECT name FROM vehicles WHERE is_archived = 0 ORDER BY name"
             )
-            return [r[0] for r in cursor.fetchall()]
+        rows = self._cached_list(
+            ("vehicle_names", include_archived), "vehicles", query
+        )
+        return [r[0] for r in rows]
 
     def add_vehicle(self, name: str) -> bool:
         """Adds a new vehicle to the database.
@@ -249,12 +404,12 @@ class DatabaseManager:
             True if successful, False if the vehicle already exists.
         """
         try:
-            with self._get_cursor() as cursor:
+            with self.conn, self._get_cursor() as cursor:
                 cursor.execute(
                     "INSERT INTO vehicles (name, is_archived) VALUES (?, 0)",
                     (name,),
                 )
-                self.conn.commit()
+            self._touch("vehicles")
             return True
         except sqlite3.IntegrityError:
             return False
@@ -280,6 +435,7 @@ class DatabaseManager:
                     (new_state, name),
                 )
                 self.conn.commit()
+                self._touch("vehicles")
                 return True
         return False
 
@@ -290,12 +446,12 @@ class DatabaseManager:
         Returns:
             A list of tuples containing checklist item details.
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                "SELECT item_name, item_type, options, validation_rule, id, "
-                "order_index FROM checklist_config ORDER BY order_index, id"
-            )
-            return cursor.fetchall()
+        return self._cached_list(
+            "checklist",
+            "checklist_config",
+            "SELECT item_name, item_type, options, validation_rule, id, "
+            "order_index FROM checklist_config ORDER BY order_index, id",
+        )
 
     def add_checklist_item(
         self,
@@ -303,7 +459,7 @@ class DatabaseManager:
         item_type: str,
         options: Optional[str] = None,
         validation_rule: Optional[str] = None
-    ) -> bool:
+    ) -> Optional[int]:
         """Adds a new item to the checklist configuration.
 
         Args:
@@ -313,7 +469,7 @@ class DatabaseManager:
             validation_rule: Rule to validate input (e.g., '>10', 'checked').
 
         Returns:
-            True if successful, False if the item already exists.
+            The ID of the new item, or None if the item already exists.
         """
         try:
             with self._get_cursor() as cursor:
@@ -330,9 +486,38 @@ class DatabaseManager:
                     (name, item_type, options, validation_rule, next_order),
                 )
                 self.conn.commit()
-            return True
+                self._touch("checklist_config")
+                return cursor.lastrowid
         except sqlite3.IntegrityError:
-            return False
+            return None
+
+    def update_checklist_item(
+        self,
+        item_id: int,
+        name: str,
+        item_type: str,
+        options: Optional[str] = None,
+        validation_rule: Optional[str] = None
+    ):
+        """Updates an existing checklist item.
+
+        Args:
+            item_id: The ID of the item to update.
+            name: The new name of the item.
+            item_type: The new type of input.
+            options: Comma-separated options for 'single_select' types.
+            validation_rule: Rule to validate input (e.g., '>10', 'checked').
+
+        Raises:
+            sqlite3.Error: If the update fails (e.g. the name is taken).
+        """
+        with self.conn, self._get_cursor() as cursor:
+            cursor.execute(
+                "UPDATE checklist_config SET item_name=?, item_type=?, "
+                "options=?, validation_rule=? WHERE id=?",
+                (name, item_type, options, validation_rule, item_id),
+            )
+        self._touch("checklist_config")
 
     def delete_checklist_item(self, item_id: int):
         """Deletes a checklist item by ID.
@@ -345,33 +530,71 @@ class DatabaseManager:
                 "DELETE FROM checklist_config WHERE id = ?", (item_id,)
             )
             self.conn.commit()
+        self._touch("checklist_config")
+
+    @staticmethod
+    def _renumber_checklist_order(cursor: sqlite3.Cursor):
+        """Gives every checklist item a distinct order_index.
+
+        Items keep their current display order (order_index, then id).
+        Nothing is written unless some order_index values are shared.
+
+        Args:
+            cursor: Cursor inside the caller's transaction.
+        """
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM checklist_config "
+            "GROUP BY order_index HAVING COUNT(*) > 1)"
+        )
+        if not cursor.fetchone()[0]:
+            return
+        cursor.execute(
+            "SELECT id FROM checklist_config ORDER BY order_index, id"
+        )
+        ids = [r[0] for r in cursor.fetchall()]
+        cursor.executemany(
+            "UPDATE checklist_config SET order_index = ? WHERE id = ?",
+            list(enumerate(ids)),
+        )
 
-    def swap_checklist_order(self, id1: int, id2: int):
+    def swap_checklist_order(self, id1: int, id2: int) -> bool:
         """Swaps the order of two checklist items.
 
         Args:
             id1: The ID of the first item.
             id2: The ID of the second item.
+
+        Returns:
+            True if the stored order changed, False if either item is gone.
         """
-        with self._get_cursor() as cursor:
+        with self.conn, self._get_cursor() as cursor:
             cursor.execute(
-                "SELECT order_index FROM checklist_config WHERE id=?", (id1,)
+                "SELECT id, order_index FROM checklist_config "
+                "WHERE id IN (?, ?)",
+                (id1, id2),
             )
-            o1 = cursor.fetchone()[0]
-            cursor.execute(
-                "SELECT order_index FROM checklist_config WHERE id=?", (id2,)
-            )
-            o2 = cursor.fetchone()[0]
+            orders = dict(cursor.fetchall())
+            if len(orders) != 2:
+                return False
+            if orders[id1] == orders[id2]:
+                # Swapping equal values would change nothing
+                self._renumber_checklist_order(cursor)
+                cursor.execute(
+                    "SELECT id, order_index FROM checklist_config "
+                    "WHERE id IN (?, ?)",
+                    (id1, id2),
+                )
+                orders = dict(cursor.fetchall())
 
+            # Both rows are rewritten from the values read above; a
+            # correlated subquery would observe the first row's new value.
             cursor.execute(
-                "UPDATE checklist_config SET order_index=? WHERE id=?",
-                (o2, id1)
+                "UPDATE checklist_config SET order_index = "
+                "CASE id WHEN ? THEN ? ELSE ? END WHERE id IN (?, ?)",
+                (id1, orders[id2], orders[id1], id1, id2),
             )
-            cursor.execute(
-                "UPDATE checklist_config SET order_index=? WHERE id=?",
-                (o1, id2)
-            )
-            self.conn.commit()
+        self._touch("checklist_config")
+        return True
 
     # --- Ignore Patterns ---
     def get_ignore_patterns(self) -> List[str]:
@@ -380,11 +603,12 @@ class DatabaseManager:
         Returns:
             A list of pattern strings.
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                "SELECT pattern FROM ignore_patterns ORDER BY pattern"
-            )
-            return [r[0] for r in cursor.fetchall()]
+        rows = self._cached_list(
+            "ignore_patterns",
+            "ignore_patterns",
+            "SELECT pattern FROM ignore_patterns ORDER BY pattern",
+        )
+        return [r[0] for r in rows]
 
     def add_ignore_pattern(self, pattern: str) -> bool:
         """Adds a new ignore pattern.
@@ -402,6 +626,7 @@ class DatabaseManager:
                     (pattern,)
                 )
                 self.conn.commit()
+            self._touch("ignore_patterns")
             return True
         except sqlite3.IntegrityError:
             return False
@@ -417,11 +642,21 @@ class DatabaseManager:
                 "DELETE FROM ignore_patterns WHERE pattern = ?", (pattern,)
             )
             self.conn.commit()
+        self._touch("ignore_patterns")
 
     # --- Settings ---
+    def _load_settings_cache(self):
+        """Loads every setting into the in-process cache in one query."""
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT key, value FROM settings")
+            self._settings_cache = dict(cursor.fetchall())
+
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Retrieves a setting value.
 
+        Values are served from an in-process cache that is loaded at startup
+        and kept current by set_setting.
+
         Args:
             key: The setting key.
             default: The default value if the key is not found.
@@ -429,10 +664,7 @@ class DatabaseManager:
         Returns:
             The setting value.
         """
-        with self._get_cursor() as cursor:
-            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-            res = cursor.fetchone()
-            return res[0] if res else default
+        return self._settings_cache.get(key, default)
 
     def set_setting(self, key: str, value: Any):
         """Sets a setting value.
@@ -447,6 +679,21 @@ class DatabaseManager:
                 (key, str(value)),
             )
             self.conn.commit()
+        self._settings_cache[key] = str(value)
+
+    def set_settings(self, settings: Dict[str, Any]):
+        """Sets several setting values in a single transaction.
+
+        Args:
+            settings: Mapping of setting keys to values.
+        """
+        rows = [(key, str(value)) for key, value in settings.items()]
+        with self.conn, self._get_cursor() as cursor:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                rows,
+            )
+        self._settings_cache.update(rows)
 
     # --- Logs ---
     def get_next_flight_id(self, date_str: str) -> int:
@@ -459,15 +706,12 @@ class DatabaseManager:
             The next available flight ID integer.
         """
         with self._get_cursor() as cursor:
-            # Use SQL aggregation to find the max flight_no.
-            # Cast to INTEGER to handle cases where flight_no is text.
+            # flight_seq is kept at MAX(flight_no) + 1 per date by triggers
             cursor.execute(
-                "SELECT MAX(CAST(flight_no AS INTEGER)) FROM logs "
-                "WHERE date = ?",
-                (date_str,),
+                "SELECT next_no FROM flight_seq WHERE date = ?", (date_str,)
             )
-            res = cursor.fetchone()[0]
-            return (res if res is not None else 0) + 1
+            res = cursor.fetchone()
+            return res[0] if res else 1
 
     def toggle_log_lock(self, log_id: int) -> bool:
         """Toggles the locked status of a flight log.
@@ -508,7 +752,7 @@ class DatabaseManager:
         if "is_locked" not in data:
             data["is_locked"] = 0
 
-        with self._get_cursor() as cursor:
+        with self.conn, self._get_cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO logs (
@@ -523,7 +767,36 @@ class DatabaseManager:
                 """,
                 data,
             )
-            self.conn.commit()
+        return True
+
+    def insert_logs(self, rows: List[Dict[str, Any]]) -> bool:
+        """Inserts multiple flight logs in a single transaction.
+
+        Args:
+            rows: A list of dictionaries containing the log data, in the same
+              format accepted by insert_log.
+
+        Returns:
+            True if successful.
+
+        Raises:
+            sqlite3.Error: If the insertion fails. No rows are inserted.
+        """
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO logs (
+                    flight_no, date, vehicle_name, mission_title, note,
+                    system_check, parameter_changes, log_file_path, is_locked
+                )
+                VALUES (
+                    :flight_no, :date, :vehicle_name, :mission_title,
+                    :note, :system_check, :parameter_changes, :log_file_path,
+                    :is_locked
+                )
+                """,
+                ({"is_locked": 0, **row} for row in rows),
+            )
         return True
 
     def update_log(self, log_id: int, data: Dict[str, Any]) -> bool:
@@ -539,7 +812,7 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If the update fails.
         """
-        with self._get_cursor() as cursor:
+        with self.conn, self._get_cursor() as cursor:
             # Ensure is_locked is present
             if "is_locked" not in data:
                 cursor.execute(
@@ -563,7 +836,6 @@ class DatabaseManager:
             """
             data["id"] = log_id
             cursor.execute(query, data)
-            self.conn.commit()
         return True
 
     def delete_log(self, log_id: int) -> bool:
@@ -576,7 +848,7 @@ class DatabaseManager:
             True if successful.
         """
         try:
-            with self._get_cursor() as cursor:
+            with self.conn, self._get_cursor() as cursor:
                 # Check if locked
                 cursor.execute(
                     "SELECT is_locked FROM logs WHERE id = ?", (log_id,)
@@ -586,11 +858,25 @@ class DatabaseManager:
                     return False
 
                 cursor.execute("DELETE FROM logs WHERE id = ?", (log_id,))
-                self.conn.commit()
             return True
         except sqlite3.Error:
             return False
 
+    @staticmethod
+    def _compose_filter_clauses() -> List[str]:
+        """Precomposes the WHERE clause for every combination of filters.
+
+        The clause for a given combination is found at the index formed by
+        the bitmask (id=1, date=2, vehicle=4), so identical filter shapes
+        always produce identical SQL and hit SQLite's statement cache.
+        """
+        conditions = ("flight_no LIKE ?", "date LIKE ?", "vehicle_name = ?")
+        clauses = []
+        for mask in range(1 << len(conditions)):
+            active = [c for i, c in enumerate(conditions) if mask & (1 << i)]
+            clauses.append(" WHERE " + " AND ".join(active) if active else "")
+        return clauses
+
     def _build_filter_query(
         self,
         base_query: str,
@@ -599,20 +885,20 @@ class DatabaseManager:
         filter_vehicle: Optional[str] = None,
     ) -> Tuple[str, List[Any]]:
         """Helper to build filter parts of a query."""
-        query = base_query + " WHERE 1=1"
+        mask = 0
         params = []
 
         if filter_id:
-            query += " AND flight_no LIKE ?"
+            mask |= 1
             params.append(f"%{filter_id}%")
         if filter_date:
-            query += " AND date LIKE ?"
+            mask |= 2
             params.append(f"%{filter_date}%")
         if filter_vehicle and filter_vehicle != "All":
-            query += " AND vehicle_name = ?"
+            mask |= 4
             params.append(filter_vehicle)
 
-        return query, params
+        return base_query + self._filter_clauses[mask], params
 
     def get_logs(
         self,
@@ -623,7 +909,8 @@ class DatabaseManager:
         sort_desc: bool = True,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-    ) -> List[Tuple]:
+        stream: bool = False,
+    ) -> Union[List[Tuple], Iterator[List[Tuple]]]:
         """Retrieves logs based on filters and pagination.
 
         Args:
@@ -634,9 +921,12 @@ class DatabaseManager:
             sort_desc: Whether to sort descending.
             limit: Maximum number of records to return.
             offset: Number of records to skip.
+            stream: If True, return an iterator yielding the rows in chunks
+              instead of materializing the full result at once.
 
         Returns:
-            A list of tuples representing the logs.
+            A list of tuples representing the logs, or an iterator of lists
+            of tuples if stream is True.
         """
         base_query = (
             "SELECT id, flight_no, date, vehicle_name, system_check, "
@@ -647,18 +937,9 @@ class DatabaseManager:
             base_query, filter_id, filter_date, filter_vehicle
         )
 
-        order = "DESC" if sort_desc else "ASC"
-        allowed_sort = [
-            "id", "flight_no", "date", "vehicle_name",
-            "system_check", "mission_title", "note", "is_locked"
-        ]
-        if sort_col not in allowed_sort:
+        if sort_col not in _ALLOWED_SORT:
             sort_col = "id"
-
-        if sort_col == "flight_no":
-            query += f" ORDER BY CAST({sort_col} AS INTEGER) {order}"
-        else:
-            query += f" ORDER BY {sort_col} {order}"
+        query += _ORDER_BY_CLAUSES[(sort_col, bool(sort_desc))]
 
         if limit is not None:
             query += " LIMIT ?"
@@ -667,10 +948,26 @@ class DatabaseManager:
             query += " OFFSET ?"
             params.append(offset)
 
+        if stream:
+            return self._stream_rows(query, params)
+
         with self._get_cursor() as cursor:
             cursor.execute(query, params)
             return cursor.fetchall()
 
+    def _stream_rows(
+        self, query: str, params: List[Any], chunk_size: int = 256
+    ) -> Iterator[List[Tuple]]:
+        """Yields the rows of a query in chunks of up to chunk_size rows."""
+        with self._get_cursor() as cursor:
+            cursor.arraysize = chunk_size
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield rows
+
     def get_logs_count(
         self,
         filter_id: Optional[str] = None,
@@ -713,23 +1010,41 @@ class DatabaseManager:
             )
             return cursor.fetchone()
 
-    def get_log_history_for_vehicle(self, vehicle_name: str) -> List[Tuple]:
-        """Retrieves log history for a specific vehicle.
+    def get_log_history_headers_for_vehicle(
+        self, vehicle_name: str
+    ) -> List[Tuple]:
+        """Retrieves log history for a vehicle without parameter content.
 
         Args:
             vehicle_name: The name of the vehicle.
 
         Returns:
-            A list of tuples (id, date, flight_no, parameter_changes).
+            A list of tuples (id, date, flight_no), newest first.
         """
         with self._get_cursor() as cursor:
             cursor.execute(
-                "SELECT id, date, flight_no, parameter_changes "
+                "SELECT id, date, flight_no "
                 "FROM logs WHERE vehicle_name = ? ORDER BY id DESC",
                 (vehicle_name,),
             )
             return cursor.fetchall()
 
+    def get_param_content(self, log_id: int) -> Optional[str]:
+        """Retrieves the parameter content of a single log.
+
+        Args:
+            log_id: The ID of the log.
+
+        Returns:
+            The parameter content, or None if the log has none.
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute(
+                "SELECT parameter_changes FROM logs WHERE id = ?", (log_id,)
+            )
+            res = cursor.fetchone()
+            return res[0] if res else None
+
     def get_locked_log_paths(self) -> List[str]:
         """Retrieves all log file paths that are locked.
 
@@ -748,32 +1063,29 @@ class DatabaseManager:
             A dictionary containing vehicles, checklist, and ignore_patterns.
         """
         settings = {}
-        with self._get_cursor() as cursor:
+        with self.conn, self._get_cursor() as cursor:
+            # Run all three reads in one read transaction so they share a
+            # single snapshot instead of locking the database per query
+            if not self.conn.in_transaction:
+                cursor.execute("BEGIN")
+
+            # Column names match the exported keys, so rows convert directly
+            cursor.row_factory = sqlite3.Row
+
             # Vehicles
             cursor.execute("SELECT name, is_archived FROM vehicles")
-            settings["vehicles"] = [
-                {"name": r[0], "is_archived": r[1]} for r in cursor.fetchall()
-            ]
+            settings["vehicles"] = [dict(r) for r in cursor]
 
             # Checklist
             cursor.execute(
                 "SELECT item_name, item_type, options, validation_rule, "
                 "order_index FROM checklist_config"
             )
-            settings["checklist"] = [
-                {
-                    "item_name": r[0],
-                    "item_type": r[1],
-                    "options": r[2],
-                    "validation_rule": r[3],
-                    "order_index": r[4],
-                }
-                for r in cursor.fetchall()
-            ]
+            settings["checklist"] = [dict(r) for r in cursor]
 
             # Ignore Patterns
             cursor.execute("SELECT pattern FROM ignore_patterns")
-            settings["ignore_patterns"] = [r[0] for r in cursor.fetchall()]
+            settings["ignore_patterns"] = [r[0] for r in cursor]
 
         return settings
 
@@ -789,42 +1101,53 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If the import fails.
         """
-        with self._get_cursor() as cursor:
+        vehicle_rows = [
+            (v["name"], v.get("is_archived", 0))
+            for v in settings.get("vehicles", [])
+        ]
+        checklist_rows = [
+            (
+                c["item_name"],
+                c["item_type"],
+                c["options"],
+                c.get("validation_rule"),
+                c["order_index"],
+            )
+            for c in settings.get("checklist", [])
+        ]
+        pattern_rows = [(p,) for p in settings.get("ignore_patterns", [])]
+
+        with self.conn, self._get_cursor() as cursor:
             # Vehicles
-            if "vehicles" in settings:
-                for v in settings["vehicles"]:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO vehicles "
-                        "(name, is_archived) VALUES (?, ?)",
-                        (v["name"], v.get("is_archived", 0)),
-                    )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO vehicles "
+                "(name, is_archived) VALUES (?, ?)",
+                vehicle_rows,
+            )
 
             # Checklist (Upsert)
-            if "checklist" in settings:
-                for c in settings["checklist"]:
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO checklist_config
-                        (item_name, item_type, options, validation_rule,
-                        order_index) VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (
-                            c["item_name"],
-                            c["item_type"],
-                            c["options"],
-                            c.get("validation_rule"),
-                            c["order_index"],
-                        ),
-                    )
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO checklist_config
+                (item_name, item_type, options, validation_rule,
+                order_index) VALUES (?, ?, ?, ?, ?)
+                """,
+                checklist_rows,
+            )
+            # Imported order values may collide with existing items
+            self._renumber_checklist_order(cursor)
 
             # Ignore Patterns
-            if "ignore_patterns" in settings:
-                for p in settings["ignore_patterns"]:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO ignore_patterns "
-                        "(pattern) VALUES (?)",
-                        (p,),
-                    )
+            cursor.executemany(
+                "INSERT OR IGNORE INTO ignore_patterns "
+                "(pattern) VALUES (?)",
+                pattern_rows,
+            )
+        self._touch("vehicles", "checklist_config", "ignore_patterns")
 
-            self.conn.commit()
+        # Refresh planner statistics for the tables the import just filled
+        self.conn.executescript(
+            "ANALYZE checklist_config; ANALYZE vehicles; "
+            "ANALYZE ignore_patterns;"
+        )
         return True
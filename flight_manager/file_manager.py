@@ -4,11 +4,242 @@ This module handles file system operations such as copying log files
 and managing directory structures.
 """
 
+import ctypes
+import datetime
+import errno
+import heapq
 import os
 import shutil
-import re
-import datetime
-from typing import List
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Maps Windows/Unix reserved filename characters and control characters to "_"
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in '<>:"/\\|?*' + "".join(chr(i) for i in range(32))}
+)
+
+# Linux FICLONE ioctl: share the source's extents (reflink) on CoW filesystems
+_FICLONE = 0x40049409
+
+# Largest request passed to a single kernel copy call
+_KERNEL_COPY_CHUNK = 1 << 30
+
+# Buffer size for the userspace copy fallback (the only path on Windows)
+_COPY_BUFSIZE = 4 << 20
+
+# Errors meaning a kernel copy path is unavailable for this pair of files
+_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+}
+
+
+def _kernel_copy_loop(
+    step: Callable[[int], int], total: Optional[int] = None
+) -> bool:
+    """Repeats a kernel copy call until it reports EOF.
+
+    Copying always runs to EOF rather than stopping at `total`, so a log
+    that is still being written isn't cut off at its earlier size.
+
+    Args:
+        step: Copies up to the given number of bytes and returns how many
+            were copied.
+        total: Size of the source when the copy started, if known. Copies
+            shorter than this are treated as failures.
+
+    Returns:
+        True if the copy completed, False if the mechanism is unsupported and
+        nothing was copied yet (so the caller can try another one).
+
+    Raises:
+        OSError: If the copy fails, or stops short of `total`, part way
+            through.
+    """
+    copied = 0
+    try:
+        while True:
+            n = step(_KERNEL_COPY_CHUNK)
+            if n == 0:
+                break
+            copied += n
+    except OSError as e:
+        if copied == 0 and e.errno in _COPY_UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+    if total is not None and copied < total:
+        # Some filesystems report 0 instead of an error when the call isn't
+        # really supported; don't mistake that for EOF
+        if copied == 0:
+            return False
+        raise OSError(
+            errno.EIO, f"Copy stopped after {copied} of {total} bytes"
+        )
+    return True
+
+
+def _fast_copy(source_path: str, dest_path: str, size: Optional[int] = None):
+    """Copies a file using the fastest mechanism the platform offers.
+
+    Tries a FICLONE reflink on Linux, then os.copy_file_range (in-kernel,
+    server-side on NFS), then os.sendfile (zero-copy), and finally a
+    userspace copy. Only the contents are copied, like shutil.copyfile.
+
+    Args:
+        source_path: Path of the file to copy.
+        dest_path: Path of the destination file.
+        size: Size of the source file in bytes, if already known.
+
+    Raises:
+        shutil.SameFileError: If source and destination are the same file.
+    """
+    # Opening the destination truncates it, so a copy onto itself must be
+    # refused first (a missing destination can't be the same file)
+    try:
+        same_file = os.path.samefile(source_path, dest_path)
+    except OSError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(
+            f"{source_path!r} and {dest_path!r} are the same file"
+        )
+
+    with open(source_path, "rb") as fsrc, open(dest_path, "wb") as fdst:
+        in_fd = fsrc.fileno()
+        out_fd = fdst.fileno()
+
+        done = False
+        if fcntl is not None and sys.platform.startswith("linux"):
+            try:
+                fcntl.ioctl(out_fd, _FICLONE, in_fd)
+                done = True
+            except OSError:
+                # Not a CoW filesystem, or source and dest on different ones
+                pass
+        if not done and hasattr(os, "copy_file_range"):
+            done = _kernel_copy_loop(
+                lambda count: os.copy_file_range(in_fd, out_fd, count), size
+            )
+        if not done and hasattr(os, "sendfile"):
+            done = _kernel_copy_loop(
+                lambda count: os.sendfile(out_fd, in_fd, None, count), size
+            )
+        if not done:
+            # One reusable 4 MiB buffer: fewer syscalls and no per-chunk bytes
+            buf = memoryview(bytearray(_COPY_BUFSIZE))
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(buf[:n])
+
+
+# Deletion batches at least this large are unlinked from a thread pool so
+# slow filesystems (network shares, scanned NTFS) can overlap the calls
+_PARALLEL_DELETE_MIN = 16
+_DELETE_WORKERS = 8
+
+# statx(2) flags: don't force attribute sync with the server (NFS/SMB), don't
+# follow symlinks, and only ask for the two fields cleanup needs.
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+_STATX_SIZE = 0x200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # Leading fields of struct statx; the kernel struct is 256 bytes.
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_rest", ctypes.c_uint8 * 128),
+    ]
+
+
+def _load_statx():
+    """Returns libc's statx function, or None if it is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_statx = _load_statx()
+
+
+def _statx_size_mtime(dirfd: int, name: str) -> Optional[Tuple[int, float]]:
+    """Fetches only size and mtime of a directory entry via statx(2).
+
+    Args:
+        dirfd: Open file descriptor of the containing directory.
+        name: Entry name relative to the directory.
+
+    Returns:
+        A (size, mtime) tuple, or None if statx is unavailable or did not
+        return both fields (the caller should fall back to os.stat).
+    """
+    if _statx is None:
+        return None
+    buf = _Statx()
+    if _statx(
+        dirfd,
+        os.fsencode(name),
+        _AT_SYMLINK_NOFOLLOW | _AT_STATX_DONT_SYNC,
+        _STATX_SIZE | _STATX_MTIME,
+        ctypes.byref(buf),
+    ) != 0:
+        return None
+    if buf.stx_mask & (_STATX_SIZE | _STATX_MTIME) != (
+        _STATX_SIZE | _STATX_MTIME
+    ):
+        return None
+    mtime = buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec * 1e-9
+    return buf.stx_size, mtime
 
 
 class FileManager:
@@ -27,6 +258,9 @@ class FileManager:
     ) -> str:
         """Copies a log file to the captured_logs directory.
 
+        Only the file contents are copied; the saved log gets default
+        permissions and its mtime is the time it was saved.
+
         Args:
             source_path: Path to the source log file.
             date_str: Date of the flight (YYYY-MM-DD).
@@ -40,30 +274,52 @@ class FileManager:
             FileNotFoundError: If the source file does not exist.
             IOError: If the file copy fails.
         """
-        if not source_path or not os.path.exists(source_path):
-            raise FileNotFoundError(f"Source file not found: {source_path}")
+        # One stat both checks existence and gives the size for the copy
+        try:
+            st = os.stat(source_path)
+        except (OSError, TypeError):
+            raise FileNotFoundError(
+                f"Source file not found: {source_path}"
+            ) from None
 
         os.makedirs(self.base_dir, exist_ok=True)
 
         # Sanitize filename components (Robust)
         # Replace Windows/Unix reserved chars: < > : " / \ | ? *
         # Also handle control characters if any
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-
-        safe_vehicle = re.sub(invalid_chars, "_", vehicle_name).strip()
-        safe_date = re.sub(invalid_chars, "_", date_str).strip()
-        safe_id = re.sub(invalid_chars, "_", str(flight_id)).strip()
+        safe_vehicle = vehicle_name.translate(_SANITIZE_TABLE).strip()
+        safe_date = date_str.translate(_SANITIZE_TABLE).strip()
+        safe_id = str(flight_id).translate(_SANITIZE_TABLE).strip()
 
         orig_filename = os.path.basename(source_path)
-        safe_orig = re.sub(invalid_chars, "_", orig_filename)
+        safe_orig = orig_filename.translate(_SANITIZE_TABLE)
 
         new_filename = f"{safe_date}_{safe_vehicle}_{safe_id}_{safe_orig}"
 
         dest_path = os.path.join(self.base_dir, new_filename)
-        shutil.copy2(source_path, dest_path)
+        _fast_copy(source_path, dest_path, st.st_size)
 
         return dest_path
 
+    @staticmethod
+    def export_file(source_path: str, dest_path: str):
+        """Copies a saved log file to a user-chosen location.
+
+        Uses the same fast copy path as save_log_file and keeps the source's
+        access and modification times on the exported copy.
+
+        Args:
+            source_path: Path to the saved log file.
+            dest_path: Path of the exported copy.
+
+        Raises:
+            OSError: If the source cannot be read or the copy fails, including
+                shutil.SameFileError when dest_path is the source itself.
+        """
+        st = os.stat(source_path)
+        _fast_copy(source_path, dest_path, st.st_size)
+        os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
     def cleanup_logs(
         self,
         max_size_gb: float = 0,
@@ -80,92 +336,170 @@ class FileManager:
         Returns:
             The number of files deleted.
         """
-        if not os.path.exists(self.base_dir):
+        if max_size_gb <= 0 and retention_days <= 0:
             return 0
 
+        # Resolve the directory once; scandir then yields absolute paths that
+        # compare directly against the normalized exclusions. A missing
+        # directory is handled by the scandir error path below.
+        base_dir = os.path.abspath(self.base_dir)
         excluded_paths = {os.path.abspath(p) for p in (excluded_paths or [])}
         deleted_count = 0
         files = []
+        total_size = 0
 
-        # 1. Gather file info with error handling
-        try:
-            dir_list = os.listdir(self.base_dir)
-        except OSError:
-            return 0
-
-        for f in dir_list:
-            full_path = os.path.abspath(os.path.join(self.base_dir, f))
-            if os.path.isfile(full_path):
-                if full_path in excluded_paths:
-                    continue
-                try:
-                    stats = os.stat(full_path)
-                    files.append({
-                        "path": full_path,
-                        "name": f,
-                        "size": stats.st_size,
-                        "mtime": stats.st_mtime
-                    })
-                except OSError:
-                    # Skip files that are inaccessible or locked during stat
-                    continue
+        # Open the directory once where supported: deletions unlink relative
+        # to it so the kernel does not re-walk base_dir each time, and on
+        # Linux the scan stats entries relative to it as well.
+        dirfd = None
+        if os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY"):
+            try:
+                dirfd = os.open(base_dir, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dirfd = None
 
         def try_remove(file_info):
-            nonlocal deleted_count
             try:
                 # On Windows, this will fail if the file is opened
-                os.remove(file_info["path"])
-                deleted_count += 1
+                if dirfd is not None:
+                    os.unlink(file_info[3], dir_fd=dirfd)
+                else:
+                    os.remove(file_info[2])
                 return True
             except (PermissionError, OSError):
                 # File might be locked or permission denied
                 return False
 
-        # 2. Date-based Cleanup
-        if retention_days > 0:
-            cutoff_date = (
-                datetime.date.today() - datetime.timedelta(days=retention_days)
-            )
-            remaining_files = []
-
-            for file_info in files:
-                should_delete = False
-
-                try:
-                    date_part = file_info["name"].split("_")[0]
-                    file_date = datetime.datetime.strptime(
-                        date_part, "%Y-%m-%d"
-                    ).date()
-                    if file_date < cutoff_date:
-                        should_delete = True
-                except (ValueError, IndexError):
-                    file_date = datetime.date.fromtimestamp(file_info["mtime"])
-                    if file_date < cutoff_date:
-                        should_delete = True
-
-                if should_delete:
-                    if not try_remove(file_info):
-                        remaining_files.append(file_info)
+        def remove_batch(batch):
+            """Deletes a batch of files; returns the files that could not be."""
+            nonlocal deleted_count, total_size
+            if len(batch) < _PARALLEL_DELETE_MIN:
+                results = [try_remove(f) for f in batch]
+            else:
+                with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as ex:
+                    results = list(ex.map(try_remove, batch))
+            failed = []
+            for file_info, removed in zip(batch, results):
+                if removed:
+                    deleted_count += 1
+                    total_size -= file_info[1]
                 else:
-                    remaining_files.append(file_info)
-
-            files = remaining_files
-
-        # 3. Size-based Cleanup
-        if max_size_gb > 0:
-            max_size_bytes = max_size_gb * 1024 * 1024 * 1024
-            total_size = sum(f["size"] for f in files)
+                    failed.append(file_info)
+            return failed
 
-            if total_size > max_size_bytes:
-                # Sort by mtime (oldest first)
-                files.sort(key=lambda x: x["mtime"])
+        try:
+            # 1. Gather file info with error handling
+            # scandir entries carry the file type (and on Windows the stat
+            # data) from the directory read, so no separate isfile per path.
+            try:
+                with os.scandir(base_dir) as it:
+                    for entry in it:
+                        try:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            if entry.path in excluded_paths:
+                                continue
+                            size_mtime = None
+                            if dirfd is not None:
+                                size_mtime = _statx_size_mtime(
+                                    dirfd, entry.name
+                                )
+                            if size_mtime is None:
+                                stats = entry.stat(follow_symlinks=False)
+                                size_mtime = (stats.st_size, stats.st_mtime)
+                        except OSError:
+                            # Skip files that are inaccessible or locked
+                            continue
+                        size, mtime = size_mtime
+                        # (mtime, size, path, name): sorts oldest first as-is
+                        files.append((mtime, size, entry.path, entry.name))
+                        total_size += size
+            except OSError:
+                return 0
+
+            # 2. Date-based Cleanup
+            if retention_days > 0:
+                cutoff_date = datetime.date.today() - datetime.timedelta(
+                    days=retention_days
+                )
+                # ISO dates sort lexicographically, so saved logs
+                # ("YYYY-MM-DD_...") can be compared as plain strings.
+                cutoff_str = cutoff_date.isoformat()
+                # Local midnight starting the cutoff day, for mtime fallbacks
+                cutoff_ts = time.mktime(cutoff_date.timetuple())
+                remaining_files = []
+                expired = []
+                # Validity of each "YYYY-MM-DD" prefix seen; logs from the
+                # same day share one, so each is parsed only once
+                valid_prefixes = {}
 
                 for file_info in files:
-                    if total_size <= max_size_bytes:
-                        break
+                    name = file_info[3]
+                    prefix = name[:10]
+                    is_iso = False
+                    if (
+                        len(name) >= 10
+                        and name[4] == "-"
+                        and name[7] == "-"
+                        and (len(name) == 10 or name[10] == "_")
+                        and prefix[:4].isdigit()
+                        and prefix[5:7].isdigit()
+                        and prefix[8:].isdigit()
+                    ):
+                        is_iso = valid_prefixes.get(prefix)
+                        if is_iso is None:
+                            try:
+                                datetime.date.fromisoformat(prefix)
+                                is_iso = True
+                            except ValueError:
+                                is_iso = False
+                            valid_prefixes[prefix] = is_iso
+
+                    if is_iso:
+                        should_delete = prefix < cutoff_str
+                    else:
+                        # strptime, not fromisoformat: unpadded dates like
+                        # "2020-1-5" still parse, compact "20200101" doesn't
+                        try:
+                            date_part = name.split("_")[0]
+                            file_date = datetime.datetime.strptime(
+                                date_part, "%Y-%m-%d"
+                            ).date()
+                            should_delete = file_date < cutoff_date
+                        except ValueError:
+                            should_delete = file_info[0] < cutoff_ts
+
+                    if should_delete:
+                        expired.append(file_info)
+                    else:
+                        remaining_files.append(file_info)
 
-                    if try_remove(file_info):
-                        total_size -= file_info["size"]
+                # Files that could not be deleted still count towards size
+                remaining_files.extend(remove_batch(expired))
+                files = remaining_files
+
+            # 3. Size-based Cleanup
+            if max_size_gb > 0:
+                max_size_bytes = int(max_size_gb * (1 << 30))
+
+                if total_size > max_size_bytes:
+                    # Pop oldest first from a min-heap on mtime; usually only
+                    # a few files need to go, so a full sort is wasted work.
+                    heapq.heapify(files)
+
+                    # Take just enough of the oldest files to get under the
+                    # limit; if some can't be deleted, take more next round.
+                    while total_size > max_size_bytes and files:
+                        excess = total_size - max_size_bytes
+                        batch = []
+                        while excess > 0 and files:
+                            file_info = heapq.heappop(files)
+                            batch.append(file_info)
+                            excess -= file_info[1]
+                        remove_batch(batch)
+        finally:
+            if dirfd is not None:
+                os.close(dirfd)
 
         return deleted_count
 
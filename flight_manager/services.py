@@ -4,10 +4,10 @@ This module handles data validation, processing, and preparation, decoupling
 logic from the UI code.
 """
 
-import json
 from typing import Any, Dict, List, Optional, Tuple
 from flight_manager import utils
 
+
 class LogService:
     """Service for handling flight log operations."""
 
@@ -40,14 +40,16 @@ class LogService:
             errors.append("Date is required.")
 
         if not skip_checklist:
-            for name, data in checklist_items.items():
-                rule = data.get("rule")
-                val = data.get("value")
-
-                if rule:
-                    is_valid, err_msg = utils.validate_checklist_rule(val, rule)
-                    if not is_valid:
-                        errors.append(f"Checklist '{name}': {err_msg}")
+            # Only items carrying a rule need evaluating
+            ruled_items = [
+                (name, data.get("value"), data["rule"])
+                for name, data in checklist_items.items()
+                if data.get("rule")
+            ]
+            for name, val, rule in ruled_items:
+                is_valid, err_msg = utils.validate_checklist_rule(val, rule)
+                if not is_valid:
+                    errors.append(f"Checklist '{name}': {err_msg}")
 
         return len(errors) == 0, errors
 
@@ -78,15 +80,12 @@ class LogService:
             A dictionary ready for DB insertion.
         """
         # Serialize Checklist
-        checklist_data = []
-        for name, data in checklist_items.items():
-            checklist_data.append({
-                "name": name,
-                "type": data["type"],
-                "value": data["value"]
-            })
+        checklist_data = [
+            {"name": name, "type": data["type"], "value": data["value"]}
+            for name, data in checklist_items.items()
+        ]
 
-        system_check_json = json.dumps(checklist_data)
+        system_check_json = utils.dump_checklist(checklist_data)
 
         return {
             "flight_no": flight_no,
@@ -9,8 +9,6 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable
 
-import tkcalendar
-
 
 class CalendarDialog(tk.Toplevel):
     """A modal dialog containing a calendar widget."""
@@ -49,6 +47,9 @@ class CalendarDialog(tk.Toplevel):
 
     def create_widgets(self):
         """Creates and arranges the widgets in the dialog."""
+        # Imported here so tkcalendar is only loaded once a picker is opened
+        import tkcalendar
+
         # Calendar Widget with specific pattern
         self.cal = tkcalendar.Calendar(
             self,
@@ -4,15 +4,69 @@ This module contains various dialog classes for settings management,
 parameter comparison, and viewing flight details.
 """
 
-import json
+import bisect
 import os
-import shutil
 import sqlite3
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Any, Callable, Optional
+from tkinter import filedialog, font, messagebox, scrolledtext, ttk
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from flight_manager import utils
+from flight_manager.file_manager import FileManager
+
+# Fixed-size fonts shared by the settings dialogs, referenced by name so
+# widgets don't each resolve their own font tuple
+_NAMED_FONTS = {
+    "FM_Body": {"family": "Segoe UI", "size": 11},
+    "FM_Bold": {"family": "Segoe UI", "size": 11, "weight": "bold"},
+    "FM_Small": {"family": "Segoe UI", "size": 9},
+}
+
+
+# Keeps the Font objects alive: tkinter deletes a named font when its Font
+# object is garbage collected
+_FONT_REFS: Dict[str, font.Font] = {}
+
+
+def _ensure_fonts(widget: tk.Misc):
+    """Creates the shared named fonts once per Tk interpreter."""
+    if "FM_Body" in font.names(widget):
+        return
+    for name, spec in _NAMED_FONTS.items():
+        _FONT_REFS[name] = font.Font(widget, name=name, **spec)
+
+
+def _run_db_query(
+    widget: tk.Misc, on_done: Callable[[Any], None], func: Callable, *args
+):
+    """Runs a database read on a thread so a slow SELECT doesn't block the UI.
+
+    The result is handed back with after(0, ...) like the main window's
+    loaders, and is dropped if the widget was destroyed in the meantime.
+
+    Args:
+        widget: Widget that receives the result.
+        on_done: Called with the query result on the main thread.
+        func: The database method to call.
+        *args: Arguments for func.
+    """
+    root = widget.nametowidget(".")
+
+    def deliver(result):
+        if widget.winfo_exists():
+            on_done(result)
+
+    def _async_fetch():
+        try:
+            result = func(*args)
+        except sqlite3.Error as e:
+            msg = f"Failed to load data: {e}"
+            root.after(0, lambda: messagebox.showerror("Database Error", msg))
+            return
+        root.after(0, lambda: deliver(result))
+
+    threading.Thread(target=_async_fetch, daemon=True).start()
 
 
 class BaseSettingsDialog(tk.Toplevel):
@@ -30,6 +84,10 @@ class BaseSettingsDialog(tk.Toplevel):
         """
         super().__init__(parent)
         self.title(title)
+        _ensure_fonts(self)
+        # Bumped by every list edit, so a load that started earlier knows
+        # its rows may be stale
+        self._list_edits = 0
 
         # Configure fonts to inherit from named fonts defined in main_window
         # This ensures consistency across all dialogs
@@ -71,12 +129,35 @@ class BaseSettingsDialog(tk.Toplevel):
             # Fallback to requested geometry if centering fails
             self.geometry(geometry)
 
+    def _load_list_async(
+        self, populate: Callable[[Any], None], fetch: Callable, *args
+    ):
+        """Loads list rows off the UI thread and shows them when ready.
+
+        If the user edited the list while the query ran, the result may
+        predate that edit, so it is discarded and the load is repeated.
+
+        Args:
+            populate: Fills the list widget from the fetched rows.
+            fetch: The database method returning the rows.
+            *args: Arguments for fetch.
+        """
+        edits = self._list_edits
+
+        def on_loaded(rows):
+            if self._list_edits != edits:
+                self._load_list_async(populate, fetch, *args)
+            else:
+                populate(rows)
+
+        _run_db_query(self, on_loaded, fetch, *args)
+
     def _create_scrolled_list(self, parent, list_height=10):
         """Creates a Frame with a Listbox and buttons."""
         container = ttk.Frame(parent)
         container.pack(fill=tk.BOTH, expand=True)
 
-        lb = tk.Listbox(container, height=list_height, font=("Segoe UI", 11))
+        lb = tk.Listbox(container, height=list_height, font="FM_Body")
         sb = ttk.Scrollbar(container, orient="vertical", command=lb.yview)
         lb.configure(yscrollcommand=sb.set)
 
@@ -133,8 +214,8 @@ class PreferencesDialog(BaseSettingsDialog):
 
         # Ensure Notebook tabs and buttons use the correct font
         style = ttk.Style()
-        style.configure("TNotebook.Tab", font=("Segoe UI", 11))
-        style.configure("Settings.TButton", font=("Segoe UI", 11))
+        style.configure("TNotebook.Tab", font="FM_Body")
+        style.configure("Settings.TButton", font="FM_Body")
 
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
@@ -167,7 +248,7 @@ class PreferencesDialog(BaseSettingsDialog):
         ttk.Label(
             btn_frame,
             text="Note: Restart may be required.",
-            font=("Segoe UI", 9),
+            font="FM_Small",
             foreground="gray"
         ).pack(side=tk.LEFT, padx=5)
 
@@ -177,7 +258,7 @@ class PreferencesDialog(BaseSettingsDialog):
         self.notebook.add(tab, text="General")
 
         ttk.Label(
-            tab, text="Font Size:", font=("Segoe UI", 11, "bold")
+            tab, text="Font Size:", font="FM_Bold"
         ).pack(anchor="w", pady=(0, 5))
         current_size = int(self.db.get_setting("font_size", 10))
         self.size_var = tk.IntVar(value=current_size)
@@ -190,19 +271,19 @@ class PreferencesDialog(BaseSettingsDialog):
             to_=24,
             textvariable=self.size_var,
             width=10,
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(side=tk.LEFT)
         ttk.Label(
-            f_frame, text="pts", font=("Segoe UI", 11)
+            f_frame, text="pts", font="FM_Body"
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Label(
-            tab, text="Default Parameter Path:", font=("Segoe UI", 11, "bold")
+            tab, text="Default Parameter Path:", font="FM_Bold"
         ).pack(anchor="w", pady=(0, 5))
         ttk.Label(
             tab,
             text="Folder used as starting directory when browsing for parameters.",
-            font=("Segoe UI", 9),
+            font="FM_Small",
             foreground="gray"
         ).pack(anchor="w", pady=(0, 5))
         path_frame = ttk.Frame(tab)
@@ -213,7 +294,7 @@ class PreferencesDialog(BaseSettingsDialog):
         ttk.Entry(
             path_frame,
             textvariable=self.default_param_path_var,
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         ttk.Button(
             path_frame,
@@ -238,7 +319,7 @@ class PreferencesDialog(BaseSettingsDialog):
         self.notebook.add(tab, text="Log Data")
 
         ttk.Label(
-            tab, text="Edit Permissions:", font=("Segoe UI", 11, "bold")
+            tab, text="Edit Permissions:", font="FM_Bold"
         ).pack(anchor="w", pady=(0, 5))
         self.vars = {}
         features = [
@@ -250,7 +331,7 @@ class PreferencesDialog(BaseSettingsDialog):
 
         # Style for checkbuttons to ensure font consistency
         style = ttk.Style()
-        style.configure("Settings.TCheckbutton", font=("Segoe UI", 11))
+        style.configure("Settings.TCheckbutton", font="FM_Body")
 
         for key, label in features:
             var = tk.BooleanVar(value=self.db.get_setting(key, "1") == "1")
@@ -262,11 +343,11 @@ class PreferencesDialog(BaseSettingsDialog):
         ttk.Separator(tab, orient="horizontal").pack(fill=tk.X, pady=15)
 
         ttk.Label(
-            tab, text="Log Storage Management:", font=("Segoe UI", 11, "bold")
+            tab, text="Log Storage Management:", font="FM_Bold"
         ).pack(anchor="w", pady=(0, 5))
         ttk.Label(
             tab, text="Max Log Folder Size (GB, 0=Unlimited):",
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(anchor="w")
         current_max_size = float(self.db.get_setting("log_max_size_gb", "0"))
         self.max_size_var = tk.DoubleVar(value=current_max_size)
@@ -277,13 +358,13 @@ class PreferencesDialog(BaseSettingsDialog):
             increment=0.1,
             textvariable=self.max_size_var,
             width=10,
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(anchor="w", pady=(0, 10))
 
         ttk.Label(
             tab,
             text="Retention Period (Days, 0=Unlimited):",
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(anchor="w")
         current_retention = int(self.db.get_setting("log_retention_days", "0"))
         self.retention_var = tk.IntVar(value=current_retention)
@@ -293,7 +374,7 @@ class PreferencesDialog(BaseSettingsDialog):
             to_=9999,
             textvariable=self.retention_var,
             width=10,
-            font=("Segoe UI", 11)
+            font="FM_Body"
         ).pack(anchor="w", pady=(0, 5))
 
     def apply_settings(self):
@@ -304,12 +385,14 @@ class PreferencesDialog(BaseSettingsDialog):
     def save_settings(self):
         """Saves the settings to the database and triggers callback."""
         new_size = self.size_var.get()
-        self.db.set_setting("font_size", new_size)
+        settings = {"font_size": new_size}
         for key, var in self.vars.items():
-            self.db.set_setting(key, "1" if var.get() else "0")
-        self.db.set_setting("log_max_size_gb", str(self.max_size_var.get()))
-        self.db.set_setting("log_retention_days", str(self.retention_var.get()))
-        self.db.set_setting("default_param_path", self.default_param_path_var.get())
+            settings[key] = "1" if var.get() else "0"
+        settings["log_max_size_gb"] = self.max_size_var.get()
+        settings["log_retention_days"] = self.retention_var.get()
+        settings["default_param_path"] = self.default_param_path_var.get()
+        # One transaction instead of a commit per setting
+        self.db.set_settings(settings)
 
         if self.on_save_callback:
             self.on_save_callback(new_size)
@@ -350,7 +433,7 @@ class IgnoreSettingsDialog(BaseSettingsDialog):
         add_frame.pack(fill=tk.X)
 
         add_frame.columnconfigure(0, weight=1)
-        self.entry_new = ttk.Entry(add_frame, font=("Segoe UI", 11))
+        self.entry_new = ttk.Entry(add_frame, font="FM_Body")
         self.entry_new.grid(row=0, column=0, sticky="ew", padx=(0, 10), ipady=3)
 
         ttk.Button(
@@ -361,17 +444,26 @@ class IgnoreSettingsDialog(BaseSettingsDialog):
 
     def load_list(self):
         """Loads ignore patterns from the database into the listbox."""
+        self._load_list_async(self._populate_list, self.db.get_ignore_patterns)
+
+    def _populate_list(self, patterns: List[str]):
+        """Fills the listbox with the loaded patterns."""
         self.lb.delete(0, tk.END)
-        for pattern in self.db.get_ignore_patterns():
-            self.lb.insert(tk.END, pattern)
+        if patterns:
+            # One insert call for all rows instead of a Tcl call per row
+            self.lb.insert(tk.END, *patterns)
 
     def add_item(self):
         """Adds a new ignore pattern."""
         val = self.entry_new.get().strip()
         if val:
             if self.db.add_ignore_pattern(val):
+                self._list_edits += 1
                 self.entry_new.delete(0, tk.END)
-                self.load_list()
+                # Insert in place, keeping the DB's ORDER BY pattern order
+                idx = bisect.bisect(self.lb.get(0, tk.END), val)
+                self.lb.insert(idx, val)
+                self.lb.see(idx)
             else:
                 messagebox.showerror("Error", "Pattern already exists!")
 
@@ -382,7 +474,8 @@ class IgnoreSettingsDialog(BaseSettingsDialog):
             val = self.lb.get(sel[0])
             if messagebox.askyesno("Confirm", f"Delete '{val}'?"):
                 self.db.delete_ignore_pattern(val)
-                self.load_list()
+                self._list_edits += 1
+                self.lb.delete(sel[0])
 
 
 class VehicleSettingsDialog(BaseSettingsDialog):
@@ -426,7 +519,7 @@ class VehicleSettingsDialog(BaseSettingsDialog):
         add_frame.pack(fill=tk.X)
 
         add_frame.columnconfigure(0, weight=1)
-        self.entry_new = ttk.Entry(add_frame, font=("Segoe UI", 11))
+        self.entry_new = ttk.Entry(add_frame, font="FM_Body")
         self.entry_new.grid(row=0, column=0, sticky="ew", padx=(0, 10), ipady=3)
 
         ttk.Button(
@@ -438,18 +531,33 @@ class VehicleSettingsDialog(BaseSettingsDialog):
 
     def load_list(self):
         """Loads vehicles from the database into the listbox."""
+        self._load_list_async(self._populate_list, self.db.get_vehicles, True)
+
+    def _populate_list(self, vehicles: List[Tuple]):
+        """Fills the listbox with the loaded (name, is_archived) rows."""
         self.lb.delete(0, tk.END)
-        for name, archived in self.db.get_vehicles(include_archived=True):
-            display = name + (" [ARCHIVED]" if archived else "")
-            self.lb.insert(tk.END, display)
+        items = [
+            name + (" [ARCHIVED]" if archived else "")
+            for name, archived in vehicles
+        ]
+        if items:
+            # One insert call for all rows instead of a Tcl call per row
+            self.lb.insert(tk.END, *items)
 
     def add_item(self):
         """Adds a new vehicle."""
         val = self.entry_new.get().strip()
         if val:
             if self.db.add_vehicle(val):
+                self._list_edits += 1
                 self.entry_new.delete(0, tk.END)
-                self.load_list()
+                # Insert in place, keeping the DB's ORDER BY name order
+                names = [
+                    s.split(" [ARCHIVED]")[0] for s in self.lb.get(0, tk.END)
+                ]
+                idx = bisect.bisect(names, val)
+                self.lb.insert(idx, val)
+                self.lb.see(idx)
             else:
                 messagebox.showerror("Error", "Vehicle already exists!")
 
@@ -457,10 +565,15 @@ class VehicleSettingsDialog(BaseSettingsDialog):
         """Toggles the archive status of the selected vehicle."""
         sel = self.lb.curselection()
         if sel:
-            full_str = self.lb.get(sel[0])
+            idx = sel[0]
+            full_str = self.lb.get(idx)
             name = full_str.split(" [ARCHIVED]")[0]
-            self.db.toggle_vehicle_archive(name)
-            self.load_list()
+            if self.db.toggle_vehicle_archive(name):
+                self._list_edits += 1
+                archived = full_str == name
+                self.lb.delete(idx)
+                self.lb.insert(idx, name + (" [ARCHIVED]" if archived else ""))
+                self.lb.selection_set(idx)
 
     def on_close(self):
         """Handles the dialog close event."""
@@ -532,26 +645,51 @@ class ChecklistSettingsDialog(BaseSettingsDialog):
 
     def load_list(self):
         """Loads checklist items from the database into the Treeview."""
-        # Clear current items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._load_list_async(
+            self._populate_list, self.db.get_checklist_items
+        )
+
+    def _populate_list(self, checklist_items: List[Tuple]):
+        """Fills the Treeview with the loaded checklist rows."""
+        # Clear current items in one call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         self.checklist_map = {}
 
-        checklist_items = self.db.get_checklist_items()
+        # Detach the scrollbar while filling so it isn't updated per row
+        yscroll = self.tree.cget("yscrollcommand")
+        self.tree.configure(yscrollcommand="")
+        try:
+            for name, itype, opts, rule, pid, _ in checklist_items:
+                self._insert_row(pid, name, itype, opts, rule)
+        finally:
+            self.tree.configure(yscrollcommand=yscroll)
 
-        for name, itype, opts, rule, pid, _ in checklist_items:
-            opts_display = opts if opts else ""
-            rule_display = rule if rule else ""
-            item_id = self.tree.insert(
-                "", tk.END, values=(name, itype, opts_display, rule_display)
-            )
-            self.checklist_map[item_id] = {
-                "id": pid,
-                "name": name,
-                "type": itype,
-                "options": opts,
-                "rule": rule,
-            }
+    def _insert_row(
+        self,
+        pid: int,
+        name: str,
+        itype: str,
+        opts: Optional[str],
+        rule: Optional[str],
+    ) -> str:
+        """Appends one checklist item to the Treeview and the item map.
+
+        Returns:
+            The Treeview item ID of the new row.
+        """
+        item_id = self.tree.insert(
+            "", tk.END, values=(name, itype, opts or "", rule or "")
+        )
+        self.checklist_map[item_id] = {
+            "id": pid,
+            "name": name,
+            "type": itype,
+            "options": opts,
+            "rule": rule,
+        }
+        return item_id
 
     def create_add_ui(self, parent):
         """Creates the UI for adding new checklist items."""
@@ -618,14 +756,14 @@ class ChecklistSettingsDialog(BaseSettingsDialog):
         rule = self.entry_rule.get().strip() or None
 
         if val:
-            if self.db.add_checklist_item(val, itype, opts, rule):
+            new_id = self.db.add_checklist_item(val, itype, opts, rule)
+            if new_id is not None:
+                self._list_edits += 1
                 self.entry_new.delete(0, tk.END)
                 self.entry_opts.delete(0, tk.END)
                 self.entry_rule.delete(0, tk.END)
-                self.load_list()
-                # Scroll to bottom
-                if self.tree.get_children():
-                    self.tree.see(self.tree.get_children()[-1])
+                # New items get the highest order index, so append
+                self.tree.see(self._insert_row(new_id, val, itype, opts, rule))
             else:
                 messagebox.showerror("Error", "Item already exists!")
 
@@ -640,28 +778,29 @@ class ChecklistSettingsDialog(BaseSettingsDialog):
         if not sel_item_id:
             return
 
-        idx = self.tree.index(sel_item_id)
-        children = self.tree.get_children()
-
-        if direction == -1 and idx > 0:
-            swap_item_id = children[idx - 1]
-        elif direction == 1 and idx < len(children) - 1:
-            swap_item_id = children[idx + 1]
+        # Only the neighbour is needed, not the whole child list
+        if direction == -1:
+            swap_item_id = self.tree.prev(sel_item_id)
+        elif direction == 1:
+            swap_item_id = self.tree.next(sel_item_id)
         else:
             return
+        if not swap_item_id:
+            return
+        idx = self.tree.index(sel_item_id)
 
         db_id1 = self.checklist_map[sel_item_id]["id"]
         db_id2 = self.checklist_map[swap_item_id]["id"]
 
-        self.db.swap_checklist_order(db_id1, db_id2)
-        self.load_list()
+        if not self.db.swap_checklist_order(db_id1, db_id2):
+            # The list is out of date; show what is actually stored
+            self.load_list()
+            return
+        self._list_edits += 1
 
-        # Restore selection
-        for item in self.tree.get_children():
-            if self.checklist_map[item]["id"] == db_id1:
-                self.tree.selection_set(item)
-                self.tree.see(item)
-                break
+        # Moving the row shifts its neighbour; selection stays on the row
+        self.tree.move(sel_item_id, "", idx + direction)
+        self.tree.see(sel_item_id)
 
     def delete_item(self):
         """Deletes the selected checklist item."""
@@ -672,7 +811,9 @@ class ChecklistSettingsDialog(BaseSettingsDialog):
         data = self.checklist_map[sel_item_id]
         if messagebox.askyesno("Confirm", f"Delete '{data['name']}'?"):
             self.db.delete_checklist_item(data["id"])
-            self.load_list()
+            self._list_edits += 1
+            self.tree.delete(sel_item_id)
+            del self.checklist_map[sel_item_id]
 
     def edit_item(self):
         """Opens a dialog to edit the selected item."""
@@ -758,21 +899,23 @@ class ChecklistSettingsDialog(BaseSettingsDialog):
                 return
 
             try:
-                cursor = self.db.conn.cursor()
-                cursor.execute(
-                    "UPDATE checklist_config SET item_name=?, item_type=?, "
-                    "options=?, validation_rule=? WHERE id=?",
-                    (new_name, new_type, new_opts, new_rule, data["id"]),
+                self.db.update_checklist_item(
+                    data["id"], new_name, new_type, new_opts, new_rule
                 )
-                self.db.conn.commit()
+                self._list_edits += 1
                 dlg.destroy()
-                self.load_list()
 
-                # Reselect
-                for item in self.tree.get_children():
-                    if self.checklist_map[item]["id"] == data["id"]:
-                        self.tree.selection_set(item)
-                        break
+                data.update(
+                    name=new_name,
+                    type=new_type,
+                    options=new_opts,
+                    rule=new_rule,
+                )
+                self.tree.item(
+                    sel_item_id,
+                    values=(new_name, new_type, new_opts or "", new_rule or ""),
+                )
+                self.tree.selection_set(sel_item_id)
 
             except sqlite3.Error as e:
                 messagebox.showerror("Error", f"Update failed: {e}", parent=dlg)
@@ -846,8 +989,7 @@ class LogEditDialog(BaseSettingsDialog):
         self.entry_date.insert(0, self.date)
 
         ttk.Label(info_frame, text="Vehicle:").grid(row=1, column=0, sticky="w")
-        vehicles = self.db.get_vehicles(include_archived=True)
-        vehicle_names = [v if isinstance(v, str) else v[0] for v in vehicles]
+        vehicle_names = self.db.get_vehicle_names(include_archived=True)
         if self.vehicle not in vehicle_names:
             vehicle_names.append(self.vehicle)
 
@@ -884,20 +1026,18 @@ class LogEditDialog(BaseSettingsDialog):
             check_frame, orient="vertical", command=canvas.yview
         )
         scroll_frame = ttk.Frame(canvas)
+        # The frame is the canvas's only item, anchored at the origin, so
+        # its new size is the scroll region; no bbox query needed
         scroll_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")),
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height)),
         )
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        checklist_data = []
-        try:
-            checklist_data = json.loads(checks_json)
-        except (json.JSONDecodeError, TypeError):
-            pass
+        checklist_data = utils.load_checklist(checks_json)
 
         for item in checklist_data:
             f = ttk.Frame(scroll_frame)
@@ -969,7 +1109,7 @@ class LogEditDialog(BaseSettingsDialog):
                 {"name": name, "type": item_type, "value": val}
             )
 
-        system_check_json = json.dumps(checklist_data)
+        system_check_json = utils.dump_checklist(checklist_data)
 
         log_data = {
             "flight_no": flight_no,
@@ -1019,6 +1159,17 @@ class ComparisonDialog(tk.Toplevel):
         self.current_content = current_content
         self.exclude_id = exclude_id
 
+        # Fetched once; re-read only if the patterns change while open
+        self._ignore_patterns = self.db.get_ignore_patterns()
+        self._ignore_version = self.db.ignore_patterns_version
+
+        # The current set never changes here, so parse it once and keep
+        # each history row's diff for when the user switches back to it
+        self._current_params = utils.parse_params(current_content)
+        self._diff_cache: Dict[int, Tuple[dict, dict, dict]] = {}
+        self._pending_after = None
+        self._last_shown = None
+
         self.title("Parameter Comparison")
         self.geometry("800x600")
 
@@ -1033,7 +1184,7 @@ class ComparisonDialog(tk.Toplevel):
 
         self.combo = ttk.Combobox(top_frame, state="readonly", width=50)
         self.combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
-        self.combo.bind("<<ComboboxSelected>>", self.update_view)
+        self.combo.bind("<<ComboboxSelected>>", self._schedule_update)
 
         font_size = int(self.db.get_setting("font_size", 10))
         self.st = scrolledtext.ScrolledText(self, font=("Consolas", font_size))
@@ -1045,22 +1196,33 @@ class ComparisonDialog(tk.Toplevel):
 
     def load_history(self):
         """Loads parameter history for the vehicle."""
-        rows = self.db.get_log_history_for_vehicle(self.vehicle)
-        valid_rows = [r for r in rows if r[0] != self.exclude_id]
+        self.history_rows: List[Tuple] = []
+        self._last_shown = None
+        # Parameter content is fetched per row only when it is compared
+        _run_db_query(
+            self,
+            self._populate_history,
+            self.db.get_log_history_headers_for_vehicle,
+            self.vehicle,
+        )
 
-        self.history_map = {
-            f"{r[0]} | Flight {r[2]} ({r[1]})": r for r in valid_rows
-        }
-        self.combo["values"] = list(self.history_map.keys())
+    def _populate_history(self, rows: List[Tuple]):
+        """Fills the history combobox and shows the default comparison."""
+        # Combobox positions index straight into this list
+        self.history_rows = [r for r in rows if r[0] != self.exclude_id]
+        self.combo["values"] = [
+            f"{r[0]} | Flight {r[2]} ({r[1]})" for r in self.history_rows
+        ]
 
-        if self.combo["values"]:
-            # Auto select previous
+        if self.history_rows:
+            # Auto select previous: rows are newest first, so the first
+            # older log is found by bisecting on the negated id
             default_index = 0
             if self.exclude_id is not None:
-                for i, row in enumerate(valid_rows):
-                    if row[0] < self.exclude_id:
-                        default_index = i
-                        break
+                neg_ids = [-r[0] for r in self.history_rows]
+                default_index = bisect.bisect_right(neg_ids, -self.exclude_id)
+                if default_index == len(self.history_rows):
+                    default_index = 0
             self.combo.current(default_index)
             self.update_view()
         else:
@@ -1069,48 +1231,242 @@ class ComparisonDialog(tk.Toplevel):
             )
             self.st.config(state="disabled")
 
+    def _schedule_update(self, unused_event=None):
+        """Coalesces rapid selection changes into one update_view call."""
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(120, self.update_view)
+
     def update_view(self, unused_event=None):
         """Updates the comparison view based on selection."""
-        sel = self.combo.get()
+        self._pending_after = None
+        sel = self.combo.current()
+
+        # Re-selecting the entry already on screen changes nothing, unless
+        # the ignore patterns were edited since it was drawn
+        shown = (sel, self.db.ignore_patterns_version)
+        if sel >= 0 and shown == self._last_shown:
+            return
+        self._last_shown = shown
+
         self.st.config(state="normal")
         self.st.delete("1.0", tk.END)
 
-        if not sel:
+        if sel < 0:
             return
 
-        row = self.history_map[sel]
-        ref_content = row[3] if row and row[3] else ""
-
-        ignore_patterns = self.db.get_ignore_patterns()
-        added, removed, changed = utils.compare_params(
-            self.current_content, ref_content, ignore_patterns
-        )
+        row = self.history_rows[sel]
+
+        if self._ignore_version != self.db.ignore_patterns_version:
+            self._ignore_patterns = self.db.get_ignore_patterns()
+            self._ignore_version = self.db.ignore_patterns_version
+            self._diff_cache.clear()
+
+        log_id = row[0]
+        diff = self._diff_cache.get(log_id)
+        if diff is None:
+            ref_content = self.db.get_param_content(log_id) or ""
+            diff = utils.compare_param_dicts(
+                self._current_params,
+                utils.parse_params(ref_content),
+                self._ignore_patterns,
+            )
+            self._diff_cache[log_id] = diff
+        added, removed, changed = diff
 
         if not added and not removed and not changed:
             self.st.insert(
                 tk.END, "No differences found (checked ignore patterns)."
             )
 
+        # One insert per section: each insert is a Tcl round-trip
         if changed:
             self.st.insert(tk.END, "--- Changed Parameters ---\n", "head")
-            for k, (old, new) in changed.items():
-                self.st.insert(tk.END, f"~ {k}: {old} -> {new}\n", "chg")
+            self.st.insert(
+                tk.END,
+                "".join(
+                    f"~ {k}: {old} -> {new}\n"
+                    for k, (old, new) in changed.items()
+                ),
+                "chg",
+            )
             self.st.insert(tk.END, "\n")
 
         if added:
             self.st.insert(tk.END, "--- Added Parameters ---\n", "head")
-            for k, v in added.items():
-                self.st.insert(tk.END, f"+ {k}: {v}\n", "add")
+            self.st.insert(
+                tk.END,
+                "".join(f"+ {k}: {v}\n" for k, v in added.items()),
+                "add",
+            )
             self.st.insert(tk.END, "\n")
 
         if removed:
             self.st.insert(tk.END, "--- Removed Parameters ---\n", "head")
-            for k, v in removed.items():
-                self.st.insert(tk.END, f"- {k}: {v}\n", "rem")
+            self.st.insert(
+                tk.END,
+                "".join(f"- {k}: {v}\n" for k, v in removed.items()),
+                "rem",
+            )
 
         self.st.config(state="disabled")
 
 
+class ChecklistCanvasView(ttk.Frame):
+    """Read-only, scrollable checklist drawn as canvas text items.
+
+    Every row is a pair of canvas items rather than a frame of ttk widgets,
+    so large checklists don't create a Tk window per row. Long values wrap
+    to the visible width, and a right-click menu copies rows to the
+    clipboard since canvas text can't be selected.
+    """
+
+    MIN_ROW_HEIGHT = 28
+    LEFT_PAD = 10
+    COLUMN_GAP = 20
+    MIN_WRAP = 80
+
+    def __init__(
+        self, parent: tk.Widget, items: List[Dict[str, Any]], height: int = 200
+    ):
+        """Initializes the ChecklistCanvasView.
+
+        Args:
+            parent: The parent widget.
+            items: Checklist entries with "name", "type" and "value" keys.
+            height: Requested height of the visible area in pixels.
+        """
+        super().__init__(parent)
+        self.items = items
+        self._row_tops: List[int] = []
+        self._content_height = 0
+        self._wrap_width: Optional[int] = None
+
+        self.canvas = tk.Canvas(self, height=height, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self.canvas.yview
+        )
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # Draw with the same font as the surrounding ttk widgets
+        self.row_font = ttk.Style(self).lookup(".", "font") or "TkDefaultFont"
+        metrics_font = font.Font(self, font=self.row_font)
+        linespace = metrics_font.metrics("linespace")
+        self.row_height = max(self.MIN_ROW_HEIGHT, linespace + 10)
+
+        # Values start past the widest label at the current font size
+        labels = [
+            f"{item.get('name', '??')}:"
+            for item in items
+            if self._is_value_row(item)
+        ]
+        self.value_x = self.LEFT_PAD + self.COLUMN_GAP
+        if labels:
+            self.value_x += max(metrics_font.measure(label) for label in labels)
+
+        self._draw(0)
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-3>", self._show_context_menu)
+
+    @staticmethod
+    def _is_value_row(item: Dict[str, Any]) -> bool:
+        """Returns True for items shown as a label and a value."""
+        return item.get("type", "checkbox") in ("text", "single_select")
+
+    @staticmethod
+    def _is_checked(item: Dict[str, Any]) -> bool:
+        """Returns the checked state of a checkbox item."""
+        val = item.get("value", "")
+        return val is True or str(val).lower() == "true"
+
+    def _row_text(self, item: Dict[str, Any]) -> str:
+        """Returns the plain-text form of a row for the clipboard."""
+        name = item.get("name", "??")
+        if self._is_value_row(item):
+            return f"{name}: {item.get('value', '')}"
+        return f"{name}: {'Yes' if self._is_checked(item) else 'No'}"
+
+    def _on_configure(self, event):
+        """Re-wraps values when the canvas width changes."""
+        wrap = max(self.MIN_WRAP, event.width - self.value_x - self.LEFT_PAD)
+        if wrap != self._wrap_width:
+            self._draw(wrap)
+
+    def _draw(self, wrap: int):
+        """Lays out every checklist row.
+
+        Args:
+            wrap: Width at which values wrap, or 0 for no wrapping.
+        """
+        self._wrap_width = wrap
+        canvas = self.canvas
+        canvas.delete("all")
+        self._row_tops = []
+
+        x = self.LEFT_PAD
+        # Checkbox rows have no value column, so they wrap across it too
+        check_wrap = wrap + self.value_x - x if wrap else 0
+        y = 0
+        for item in self.items:
+            self._row_tops.append(y)
+            text_y = y + 5
+            name = item.get("name", "??")
+            if self._is_value_row(item):
+                canvas.create_text(
+                    x, text_y, text=f"{name}:", anchor="nw", font=self.row_font
+                )
+                text_id = canvas.create_text(
+                    self.value_x,
+                    text_y,
+                    text=str(item.get("value", "")),
+                    anchor="nw",
+                    font=self.row_font,
+                    width=wrap,
+                )
+            else:
+                mark = "✓" if self._is_checked(item) else "✗"
+                text_id = canvas.create_text(
+                    x,
+                    text_y,
+                    text=f"{mark}  {name}",
+                    anchor="nw",
+                    font=self.row_font,
+                    width=check_wrap,
+                )
+            bbox = canvas.bbox(text_id)
+            text_height = bbox[3] - bbox[1] if bbox else 0
+            y += max(self.row_height, text_height + 10)
+        self._content_height = y
+        canvas.configure(scrollregion=(0, 0, 0, y))
+
+    def _show_context_menu(self, event: tk.Event):
+        """Offers copying the clicked row or the whole checklist."""
+        if not self.items:
+            return
+        y = self.canvas.canvasy(event.y)
+        idx = bisect.bisect_right(self._row_tops, y)
+        menu = tk.Menu(self, tearoff=0)
+        if 0 < idx and y < self._content_height:
+            row_text = self._row_text(self.items[idx - 1])
+            menu.add_command(
+                label="Copy", command=lambda: self._copy(row_text)
+            )
+        menu.add_command(
+            label="Copy All",
+            command=lambda: self._copy(
+                "\n".join(self._row_text(item) for item in self.items)
+            ),
+        )
+        menu.post(event.x_root, event.y_root)
+
+    def _copy(self, text: str):
+        """Places text on the clipboard."""
+        self.clipboard_clear()
+        self.clipboard_append(text)
+
+
 class FlightDetailsDialog(tk.Toplevel):
     """Dialog for viewing flight details."""
 
@@ -1247,47 +1603,11 @@ class FlightDetailsDialog(tk.Toplevel):
         )
         check_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        canvas = tk.Canvas(check_frame, height=200)
-        scrollbar = ttk.Scrollbar(
-            check_frame, orient="vertical", command=canvas.yview
-        )
-        scroll_frame = ttk.Frame(canvas)
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")),
-        )
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        checklist_data = []
-        try:
-            checklist_data = json.loads(checks_json)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-        for item in checklist_data:
-            f = ttk.Frame(scroll_frame)
-            f.pack(fill=tk.X, pady=2, padx=5)
-
-            name = item.get("name", "??")
-            itype = item.get("type", "checkbox")
-            val = item.get("value", "")
+        checklist_data = utils.load_checklist(checks_json)
 
-            if itype in ("text", "single_select"):
-                ttk.Label(f, text=f"{name}:", width=25).pack(side=tk.LEFT)
-                e = ttk.Entry(f)
-                e.insert(0, str(val))
-                e.state(["readonly"])
-                e.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            else:
-                is_checked = val is True or str(val).lower() == "true"
-                var = tk.BooleanVar(value=is_checked)
-                chk = ttk.Checkbutton(f, text=name, variable=var)
-                chk.state(["disabled", "!alternate"])
-                chk.var = var
-                chk.pack(side=tk.LEFT)
+        ChecklistCanvasView(check_frame, checklist_data, height=200).pack(
+            fill=tk.BOTH, expand=True
+        )
 
         param_frame = ttk.LabelFrame(
             self.container, text="Parameter Data", padding=10
@@ -1484,6 +1804,45 @@ class FlightDetailsDialog(tk.Toplevel):
             else:
                 messagebox.showerror("Error", "Failed to delete flight log.")
 
+    def _run_async(
+        self,
+        fn: Callable[[], None],
+        on_done: Callable[[Optional[OSError]], None],
+    ):
+        """Runs blocking file I/O on a daemon thread.
+
+        The outcome is handed to the root window's event loop, so it is
+        still reported if this dialog is closed before the work finishes.
+
+        Args:
+            fn: The file operation to run.
+            on_done: Called on the main thread with the OSError raised, or
+                None on success.
+        """
+        root = self.nametowidget(".")
+
+        def _worker():
+            try:
+                fn()
+            except OSError as e:
+                root.after(0, on_done, e)
+                return
+            root.after(0, on_done, None)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    @staticmethod
+    def _on_export_done(error: Optional[OSError], message: str):
+        """Reports the outcome of a background export.
+
+        No parent is passed, so the message box belongs to the root window
+        and still appears after the details dialog has been closed.
+        """
+        if error is None:
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", f"Export failed: {error}")
+
     def export_params(self):
         """Exports the parameter data to a text file."""
         f = filedialog.asksaveasfilename(
@@ -1491,12 +1850,20 @@ class FlightDetailsDialog(tk.Toplevel):
             initialfile=f"params_{self.date}_{self.flight_no}.txt",
         )
         if f:
-            try:
-                with open(f, "w", encoding="utf-8") as file:
-                    file.write(self.param_content)
-                messagebox.showinfo("Success", "Parameters exported.")
-            except OSError as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+            # Encode once and hand the whole buffer to a single write
+            data = (self.param_content or "").encode("utf-8")
+            if os.linesep != "\n":
+                # Keep the platform line endings text mode used to write
+                data = data.replace(b"\n", os.linesep.encode("ascii"))
+
+            def write():
+                with open(f, "wb") as file:
+                    file.write(data)
+
+            self._run_async(
+                write,
+                lambda err: self._on_export_done(err, "Parameters exported."),
+            )
 
     def export_log(self):
         """Exports the log file to a user-selected location."""
@@ -1509,9 +1876,8 @@ class FlightDetailsDialog(tk.Toplevel):
             initialfile=os.path.basename(self.log_path),
         )
         if f:
-            try:
-                shutil.copy2(self.log_path, f)
-                messagebox.showinfo("Success", "Log file exported.")
-            except OSError as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+            self._run_async(
+                lambda: FileManager.export_file(self.log_path, f),
+                lambda err: self._on_export_done(err, "Log file exported."),
+            )
 
@@ -129,6 +129,7 @@ class FlightManagerApp:
                 self.file_manager.cleanup_logs(max_size, retention, excluded)
         except (ValueError, sqlite3.Error, OSError):
             pass
+        self.db.close()
         self.root.destroy()
 
     def change_filter_date(self, days: int):
@@ -2,10 +2,17 @@
 
 import ast
 import fnmatch
+import functools
+import json
 import operator as op_lib
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is the fallback
+    orjson = None
+
 # Security-safe operators mapping for AST evaluation
 SAFE_OPERATORS = {
     ast.Add: op_lib.add,
@@ -210,6 +217,14 @@ def parse_params(content: str) -> Dict[str, str]:
     return params
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_ignore_patterns(ignore_patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compiles glob patterns into one alternation regex (memoized)."""
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in ignore_patterns)
+    )
+
+
 def filter_params(
     params: Dict[str, str], ignore_patterns: Optional[List[str]]
 ) -> Dict[str, str]:
@@ -227,10 +242,7 @@ def filter_params(
 
     # Convert glob patterns to a single optimized regex
     try:
-        regex_str = "|".join(
-            f"(?:{fnmatch.translate(p)})" for p in ignore_patterns
-        )
-        pattern = re.compile(regex_str)
+        pattern = _compile_ignore_patterns(tuple(ignore_patterns))
     except re.error:
         # Fallback to individual glob matching if regex compilation fails
         filtered = {}
@@ -257,9 +269,30 @@ def compare_params(
     Returns:
         A tuple containing three dictionaries: added, removed, and changed.
     """
-    curr_dict = parse_params(current_content)
-    ref_dict = parse_params(ref_content)
+    return compare_param_dicts(
+        parse_params(current_content),
+        parse_params(ref_content),
+        ignore_patterns,
+    )
+
+
+def compare_param_dicts(
+    curr_dict: Dict[str, str],
+    ref_dict: Dict[str, str],
+    ignore_patterns: Optional[List[str]] = None,
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, Tuple[str, str]]]:
+    """Compares two already-parsed parameter dictionaries.
 
+    Lets callers that compare one parameter set against many parse it once.
+
+    Args:
+        curr_dict: The current parameters, as returned by parse_params.
+        ref_dict: The reference parameters, as returned by parse_params.
+        ignore_patterns: A list of patterns to ignore during comparison.
+
+    Returns:
+        A tuple containing three dictionaries: added, removed, and changed.
+    """
     curr_dict = filter_params(curr_dict, ignore_patterns or [])
     ref_dict = filter_params(ref_dict, ignore_patterns or [])
 
@@ -274,3 +307,40 @@ def compare_params(
     return added, removed, changed
 
 
+def load_checklist(checks_json: Optional[str]) -> List[Dict[str, Any]]:
+    """Parses a log's stored system_check JSON into checklist entries.
+
+    Saved checklists are always JSON arrays, so anything else (None, empty
+    or malformed values) is rejected by a shape check instead of raising
+    through the parser.
+
+    Args:
+        checks_json: The stored system_check value.
+
+    Returns:
+        The list of checklist entries, or an empty list.
+    """
+    if not isinstance(checks_json, str) or not checks_json.startswith("["):
+        return []
+    try:
+        if orjson is not None:
+            data = orjson.loads(checks_json)
+        else:
+            data = json.loads(checks_json)
+    except ValueError:
+        return []
+    return data if isinstance(data, list) else []
+
+
+def dump_checklist(checklist_data: List[Dict[str, Any]]) -> str:
+    """Serializes checklist entries for the system_check column.
+
+    Args:
+        checklist_data: Checklist entries with "name", "type" and "value".
+
+    Returns:
+        The JSON array as a string.
+    """
+    if orjson is not None:
+        return orjson.dumps(checklist_data).decode()
+    return json.dumps(checklist_data)